@@ -3,16 +3,14 @@
 Simple run script for Automata application.
 """
 
-import os
 import sys
 from pathlib import Path
 
-# Add src directory to path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
-# Change to src directory
-os.chdir(src_path)
+# Add src directory to path; main.py resolves the frontend by absolute path,
+# so the working directory does not need to change
+src_path = str(Path(__file__).resolve().parent / "src")
+if src_path not in sys.path:
+    sys.path.insert(0, src_path)
 
 # Import and run the main application
 from main import main
@@ -3,7 +3,9 @@ Configuration package for the application.
 Provides centralized configuration management with environment support.
 """
 
-from .app_settings import AppSettings, WindowSettings, ServerSettings, AppMetadata
+from .app_settings import (
+    AppSettings, WindowSettings, ServerSettings, AppMetadata, reset_env_cache
+)
 from .constants import Constants, ErrorCodes, LogMessages
 
 __all__ = [
@@ -11,6 +13,7 @@ __all__ = [
     'WindowSettings', 
     'ServerSettings',
     'AppMetadata',
+    'reset_env_cache',
     'Constants',
     'ErrorCodes',
     'LogMessages'
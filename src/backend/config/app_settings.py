@@ -4,19 +4,46 @@ Provides configuration management with environment variable support.
 """
 
 import os
-from dataclasses import dataclass
-from typing import Tuple, Optional
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Tuple, Optional, FrozenSet, Final
 from pathlib import Path
 
+_TRUTHY_VALUES: FrozenSet[str] = frozenset({'true', '1', 'yes', 'on'})
+_TRUE_STR = 'true'
+_FALSE_STR = 'false'
 
-@dataclass(frozen=True)
+# Resolved once at import; the frontend location is fixed for the process lifetime
+_FRONTEND_PATH: Final[Path] = Path(__file__).resolve().parent.parent.parent / 'frontend'
+
+
+@lru_cache(maxsize=None)
+def _env(key: str, default: str) -> str:
+    """Read an environment variable once; the environment is fixed at runtime."""
+    return os.getenv(key, default)
+
+
+@lru_cache(maxsize=None)
+def _env_bool(key: str, default: bool) -> bool:
+    """Read and parse a boolean environment variable once."""
+    default_str = _TRUE_STR if default else _FALSE_STR
+    return _env(key, default_str).lower() in _TRUTHY_VALUES
+
+
+def reset_env_cache() -> None:
+    """Clear cached environment lookups (mainly for testing)."""
+    _env.cache_clear()
+    _env_bool.cache_clear()
+
+
+@dataclass(frozen=True, slots=True)
 class WindowSettings:
     """Window-specific configuration settings."""
     size: Tuple[int, int] = (1200, 800)
     position: Tuple[int, int] = (100, 100)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ServerSettings:
     """Server-specific configuration settings."""
     host: str = 'localhost'
@@ -24,7 +51,7 @@ class ServerSettings:
     mode: str = 'chrome-app'
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppMetadata:
     """Application metadata and information."""
     name: str = "Automata"
@@ -32,46 +59,40 @@ class AppMetadata:
     description: str = "A modern Python Eel application"
 
 
+@dataclass(frozen=True, slots=True)
 class AppSettings:
     """Main application settings manager."""
+    debug: bool = True
+    disable_cache: bool = True
+    window: WindowSettings = field(default_factory=WindowSettings)
+    server: ServerSettings = field(default_factory=ServerSettings)
+    app: AppMetadata = field(default_factory=AppMetadata)
+    frontend_path: Path = _FRONTEND_PATH
+    is_development: bool = field(init=False)
+    
+    def __post_init__(self):
+        """Derive computed settings once so reads are plain attribute loads."""
+        object.__setattr__(self, 'is_development', self.debug)
     
-    def __init__(self):
-        """Initialize settings with environment support."""
-        self._debug = self._get_bool_env('DEBUG', True)
-        self._disable_cache = self._get_bool_env('DISABLE_CACHE', True)
+    @classmethod
+    def from_env(cls) -> 'AppSettings':
+        """
+        Create settings from environment variables.
         
-        self.window = WindowSettings()
-        self.server = ServerSettings(
-            host=os.getenv('HOST', 'localhost'),
-            port=int(os.getenv('PORT', '8000')),
-            mode=os.getenv('MODE', 'chrome-app')
+        Returns:
+            Settings populated from the process environment
+        """
+        return cls(
+            debug=cls._get_bool_env('DEBUG', True),
+            disable_cache=cls._get_bool_env('DISABLE_CACHE', True),
+            server=ServerSettings(
+                host=_env('HOST', 'localhost'),
+                port=int(_env('PORT', '8000')),
+                mode=_env('MODE', 'chrome-app')
+            )
         )
-        self.app = AppMetadata()
-    
-    @property
-    def debug(self) -> bool:
-        """Get debug mode status."""
-        return self._debug
-    
-    @property
-    def disable_cache(self) -> bool:
-        """Get cache disable status."""
-        return self._disable_cache
-    
-    @property
-    def is_development(self) -> bool:
-        """Check if running in development mode."""
-        return self._debug
-    
-    @property
-    def frontend_path(self) -> Path:
-        """Get the frontend directory path."""
-        current_file = Path(__file__)
-        backend_dir = current_file.parent.parent
-        return backend_dir.parent / 'frontend'
     
     @staticmethod
     def _get_bool_env(key: str, default: bool) -> bool:
         """Get boolean value from environment variable."""
-        value = os.getenv(key, str(default)).lower()
-        return value in ('true', '1', 'yes', 'on') 
\ No newline at end of file
+        return _env_bool(key, default)
@@ -10,7 +10,7 @@ from .app.application import Application, ApplicationFactory
 from .di.container import Container, IContainer, get_container, reset_container
 from .di.registry import (
     ServiceRegistry, ServiceDiscovery, FeatureManager, IFeatureManager,
-    Service, get_service_registry, auto_discover_services
+    Service, get_service_registry, auto_discover_services, reset_discovery_plans
 )
 from .di.singleton_factory import (
     ISingletonFactory, SingletonFactory, SingletonRegistry,
@@ -62,6 +62,7 @@ __all__ = [
     'Service',
     'get_service_registry',
     'auto_discover_services',
+    'reset_discovery_plans',
     
     # Singleton Management
     'ISingletonFactory',
@@ -4,7 +4,7 @@ Main entry point for application coordination and initialization.
 """
 
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence, Tuple
 
 from ..di.registry import IFeatureManager, FeatureManager
 from ..framework.eel_setup import IEelConfigurator, EelConfigurator
@@ -13,6 +13,11 @@ from ...config.app_settings import AppSettings
 
 logger = logging.getLogger(__name__)
 
+# Application lifecycle states
+_STATE_UNINITIALIZED = 0
+_STATE_CONFIGURED = 1
+_STATE_STARTED = 2
+
 
 class Application:
     """
@@ -20,6 +25,11 @@ class Application:
     Handles application lifecycle, initialization, and coordination of components.
     """
     
+    __slots__ = ('_feature_manager', '_eel_configurator', '_settings', '_state')
+    
+    # Application status section once started; a started app always has settings
+    _STATUS_STARTED: Dict[str, Any] = {'initialized': True, 'settings_loaded': True}
+    
     def __init__(self, 
                  feature_manager: IFeatureManager, 
                  eel_configurator: IEelConfigurator,
@@ -38,19 +48,24 @@ class Application:
         self._feature_manager = feature_manager
         self._eel_configurator = eel_configurator
         self._settings = settings
-        self._is_initialized = False
+        self._state = _STATE_UNINITIALIZED
+    
+    @property
+    def feature_manager(self) -> IFeatureManager:
+        """Get the feature manager."""
+        return self._feature_manager
     
     @property
     def is_initialized(self) -> bool:
         """Check if application is initialized."""
-        return self._is_initialized
+        return self._state == _STATE_STARTED
     
-    def start(self, feature_modules: list = None) -> bool:
+    def start(self, feature_modules: Sequence[Tuple[str, str]] = None) -> bool:
         """
         Start the application with full initialization sequence.
         
         Args:
-            feature_modules: List of feature modules to register
+            feature_modules: Sequence of (feature_name, module_path) tuples to register
         
         Returns:
             True if startup successful, False otherwise
@@ -61,25 +76,29 @@ class Application:
             # Register all features if provided
             if feature_modules and not self._feature_manager.register_features(feature_modules):
                 raise Exception("Failed to register features")
+            self._state = _STATE_CONFIGURED
             
             # Configure Eel framework
             self._eel_configurator.configure_eel(self._settings)
             
-            self._is_initialized = True
+            self._state = _STATE_STARTED
             logger.info(LoggingConstants.INIT_SUCCESS)
             return True
             
         except Exception as e:
-            logger.error(LoggingConstants.INIT_FAILED.format(e))
+            logger.error(LoggingConstants.INIT_FAILED, e)
             return False
     
     def get_status(self) -> Dict[str, Any]:
         """Get comprehensive application status."""
         status = self._feature_manager.get_features_status()
-        status['application'] = {
-            'initialized': self._is_initialized,
-            'settings_loaded': self._settings is not None
-        }
+        if self._state == _STATE_STARTED:
+            status['application'] = self._STATUS_STARTED.copy()
+        else:
+            status['application'] = {
+                'initialized': False,
+                'settings_loaded': self._settings is not None
+            }
         return status
 
 
@@ -98,7 +117,7 @@ class ApplicationFactory:
             Configured Application instance
         """
         # Create default dependencies
-        app_settings = settings or AppSettings()
+        app_settings = settings or AppSettings.from_env()
         feature_manager = FeatureManager()
         eel_configurator = EelConfigurator()
         
@@ -143,6 +162,6 @@ class ApplicationFactory:
         # Create test dependencies with defaults
         test_feature_manager = feature_manager or FeatureManager()
         test_eel_configurator = eel_configurator or EelConfigurator()
-        test_settings = settings or AppSettings()
+        test_settings = settings or AppSettings.from_env()
         
         return Application(test_feature_manager, test_eel_configurator, test_settings) 
\ No newline at end of file
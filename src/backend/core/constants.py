@@ -3,14 +3,14 @@ Core constants and configuration values.
 Centralized constants to eliminate magic strings and improve maintainability.
 """
 
-from enum import Enum, auto
+from enum import IntEnum, auto
 from typing import Final
 
 
 class ServiceConstants:
     """Constants related to service management."""
     
-    # Service detection
+    # Service detection; registration reads `_service_name` directly, keep in sync
     SERVICE_NAME_ATTRIBUTE: Final[str] = '_service_name'
     INTERFACES_ATTRIBUTE: Final[str] = '__interfaces__'
     
@@ -57,30 +57,34 @@ class ResponseConstants:
 
 
 class LoggingConstants:
-    """Constants for logging messages."""
+    """
+    Constants for logging messages.
+    Templates use %-style placeholders so loggers format them lazily.
+    """
     
     # Application lifecycle
     INIT_START: Final[str] = "Application initialization started"
     INIT_SUCCESS: Final[str] = "Application initialized successfully"
-    INIT_FAILED: Final[str] = "Application initialization failed: {}"
+    INIT_FAILED: Final[str] = "Application initialization failed: %s"
     APP_CLOSING: Final[str] = "Application is closing"
+    CLEANUP_FEATURE: Final[str] = "Cleaning up feature: %s"
     
     # Service management
-    SERVICE_INIT_SUCCESS: Final[str] = "Service '{}' initialized successfully"
-    SERVICE_INIT_FAILED: Final[str] = "Service '{}' initialization failed: {}"
+    SERVICE_INIT_SUCCESS: Final[str] = "Service '%s' initialized successfully"
+    SERVICE_INIT_FAILED: Final[str] = "Service '%s' initialization failed: %s"
     
     # Feature management
-    FEATURE_REGISTERING: Final[str] = "Registering feature: {}"
-    FEATURE_SUCCESS: Final[str] = "Feature '{}' registered successfully"
-    FEATURE_FAILED: Final[str] = "Feature '{}' registration failed"
-    FEATURES_REGISTERED: Final[str] = "All features registered: {}"
+    FEATURE_REGISTERING: Final[str] = "Registering feature: %s"
+    FEATURE_SUCCESS: Final[str] = "Feature '%s' registered successfully"
+    FEATURE_FAILED: Final[str] = "Feature '%s' registration failed"
+    FEATURES_REGISTERED: Final[str] = "All features registered: %s"
     
     # Web layer
     EEL_CONFIGURED: Final[str] = "Eel framework configured successfully"
     STATUS_RETRIEVED: Final[str] = "Application status retrieved successfully"
 
 
-class ErrorCodes(Enum):
+class ErrorCodes(IntEnum):
     """Enumeration of application error codes."""
     
     # General errors
@@ -3,15 +3,24 @@ Dependency injection container.
 Provides centralized dependency management and service resolution.
 """
 
-from typing import Dict, TypeVar, Type, Optional, Callable, Any
+from typing import Dict, TypeVar, Type, Callable, Any, Tuple, Iterable
 from abc import ABC, abstractmethod
 
+from ..constants import ContainerConstants
+
 T = TypeVar('T')
 
+# Registration kinds stored alongside each registry entry
+_INSTANCE = 0
+_CLASS = 1
+_FACTORY = 2
+
 
 class IContainer(ABC):
     """Interface for dependency injection container."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def register(self, interface: Type[T], implementation: Type[T], 
                  singleton: bool = True) -> None:
@@ -23,6 +32,11 @@ class IContainer(ABC):
         """Register a service instance."""
         pass
     
+    def register_instances(self, pairs: Iterable[Tuple[Type, Any]]) -> None:
+        """Register several (interface, instance) pairs in one call."""
+        for interface, instance in pairs:
+            self.register_instance(interface, instance)
+    
     @abstractmethod
     def resolve(self, interface: Type[T]) -> T:
         """Resolve a service instance."""
@@ -37,11 +51,12 @@ class IContainer(ABC):
 class Container(IContainer):
     """Simple dependency injection container implementation."""
     
+    __slots__ = ('_registry',)
+    
     def __init__(self):
         """Initialize the container."""
-        self._services: Dict[Type, Any] = {}
-        self._singletons: Dict[Type, Any] = {}
-        self._factories: Dict[Type, Callable] = {}
+        # Single lookup table of interface -> (kind, target)
+        self._registry: Dict[Type, Tuple[int, Any]] = {}
     
     def register(self, interface: Type[T], implementation: Type[T], 
                  singleton: bool = True) -> None:
@@ -53,10 +68,7 @@ class Container(IContainer):
             implementation: The implementation type
             singleton: Whether to use singleton pattern
         """
-        if singleton:
-            self._services[interface] = implementation
-        else:
-            self._factories[interface] = implementation
+        self._registry[interface] = (_CLASS if singleton else _FACTORY, implementation)
     
     def register_instance(self, interface: Type[T], instance: T) -> None:
         """
@@ -66,7 +78,18 @@ class Container(IContainer):
             interface: The interface type
             instance: The service instance
         """
-        self._singletons[interface] = instance
+        self._registry[interface] = (_INSTANCE, instance)
+    
+    def register_instances(self, pairs: Iterable[Tuple[Type, Any]]) -> None:
+        """
+        Register several service instances with a single dict update.
+        
+        Args:
+            pairs: Iterable of (interface, instance) pairs
+        """
+        self._registry.update(
+            (interface, (_INSTANCE, instance)) for interface, instance in pairs
+        )
     
     def register_factory(self, interface: Type[T], factory: Callable[[], T]) -> None:
         """
@@ -76,7 +99,7 @@ class Container(IContainer):
             interface: The interface type
             factory: Factory function
         """
-        self._factories[interface] = factory
+        self._registry[interface] = (_FACTORY, factory)
     
     def resolve(self, interface: Type[T]) -> T:
         """
@@ -91,21 +114,21 @@ class Container(IContainer):
         Raises:
             ValueError: If service is not registered
         """
-        # Check for existing singleton instance
-        if interface in self._singletons:
-            return self._singletons[interface]
+        try:
+            kind, target = self._registry[interface]
+        except KeyError:
+            raise ValueError(f"Service {interface.__name__} is not registered") from None
         
-        # Check for registered singleton service
-        if interface in self._services:
-            if interface not in self._singletons:
-                self._singletons[interface] = self._services[interface]()
-            return self._singletons[interface]
+        if kind == _INSTANCE:
+            return target
         
-        # Check for factory
-        if interface in self._factories:
-            return self._factories[interface]()
+        if kind == _CLASS:
+            # Materialize the singleton once; later resolves hit the instance branch
+            instance = target()
+            self._registry[interface] = (_INSTANCE, instance)
+            return instance
         
-        raise ValueError(f"Service {interface.__name__} is not registered")
+        return target()
     
     def is_registered(self, interface: Type[T]) -> bool:
         """
@@ -117,30 +140,23 @@ class Container(IContainer):
         Returns:
             True if service is registered
         """
-        return (interface in self._services or 
-                interface in self._singletons or 
-                interface in self._factories)
+        return interface in self._registry
     
     def clear(self) -> None:
         """Clear all registered services."""
-        self._services.clear()
-        self._singletons.clear()
-        self._factories.clear()
-
-
-# Import singleton factory
-from .singleton_factory import get_singleton_registry, create_singleton_factory
-
-# Initialize singleton factory for container
-_container_factory = create_singleton_factory(lambda: Container())
-get_singleton_registry().register_factory('container', _container_factory)
+        self._registry.clear()
 
 
 def get_container() -> Container:
-    """Get the global container instance."""
-    return get_singleton_registry().get_instance('container')
+    """Get the global container instance from the singleton registry."""
+    from .singleton_factory import get_singleton_registry
+    factory = get_singleton_registry().get_or_register_factory(
+        ContainerConstants.CONTAINER_REGISTRY_NAME, Container
+    )
+    return factory.get_instance()
 
 
 def reset_container() -> None:
     """Reset the global container (mainly for testing)."""
-    get_singleton_registry().reset_instance('container') 
\ No newline at end of file
+    from .singleton_factory import get_singleton_registry
+    get_singleton_registry().reset_instance(ContainerConstants.CONTAINER_REGISTRY_NAME)
@@ -4,7 +4,8 @@ Handles automatic interface detection and registration with DI container.
 """
 
 import logging
-from typing import Type, List
+from functools import lru_cache
+from typing import Type, Sequence, Tuple
 from abc import ABC, abstractmethod
 
 from ..services.base import BaseService
@@ -28,7 +29,7 @@ class InterfaceDetectionStrategy(ABC):
     """Strategy for detecting interfaces implemented by a service."""
     
     @abstractmethod
-    def get_interfaces(self, service_class: Type[BaseService]) -> List[Type]:
+    def get_interfaces(self, service_class: Type[BaseService]) -> Sequence[Type]:
         """Get all interfaces implemented by a service class."""
         pass
 
@@ -39,41 +40,45 @@ class AbstractMethodInterfaceStrategy(InterfaceDetectionStrategy):
     Finds classes with abstract methods in the inheritance chain.
     """
     
-    def get_interfaces(self, service_class: Type[BaseService]) -> List[Type]:
+    def get_interfaces(self, service_class: Type[BaseService]) -> Sequence[Type]:
         """Get interfaces based on abstract method presence."""
-        interfaces = []
-        
-        # Check direct base classes
-        for base_class in service_class.__bases__:
-            if self._is_interface(base_class):
-                interfaces.append(base_class)
-        
-        # Check full inheritance chain (MRO - Method Resolution Order)
-        for interface in service_class.__mro__:
-            if self._is_interface_in_mro(interface):
-                interfaces.append(interface)
-        
-        return interfaces
+        return _interfaces_for(service_class)
+
+
+@lru_cache(maxsize=None)
+def _interfaces_for(service_class: Type[BaseService]) -> Tuple[Type, ...]:
+    """
+    Collect the interfaces of a service class in a single MRO pass.
     
-    def _is_interface(self, class_type: Type) -> bool:
-        """Check if a class is an interface based on abstract methods."""
-        return (hasattr(class_type, '__abstractmethods__') and 
-                class_type.__abstractmethods__ and 
-                class_type is not BaseService)
+    Direct base classes count as interfaces whenever they declare abstract
+    methods; deeper ancestors must also follow the interface naming convention.
+    Results are cached per class since class hierarchies do not change.
+    """
+    direct_bases = service_class.__bases__
+    interfaces = []
     
-    def _is_interface_in_mro(self, class_type: Type) -> bool:
-        """Check if a class in MRO is an interface."""
-        return (hasattr(class_type, '__abstractmethods__') and 
-                class_type.__abstractmethods__ and 
-                class_type is not BaseService and
-                self._follows_interface_naming_convention(class_type))
+    for class_type in service_class.__mro__:
+        if _is_interface(class_type, direct_bases):
+            interfaces.append(class_type)
     
-    def _follows_interface_naming_convention(self, class_type: Type) -> bool:
-        """Check if class follows interface naming convention."""
-        # Convention: interfaces start with 'I' and end with 'Service' or just 'I'
-        name = class_type.__name__
-        return (name.startswith('I') and 
-                (name.endswith('Service') or len(name) > 1))
+    return tuple(interfaces)
+
+
+def _is_interface(class_type: Type, direct_bases: Tuple[Type, ...]) -> bool:
+    """Check if a class is an interface, running the cheapest checks first."""
+    if class_type is BaseService:
+        return False
+    
+    # Read from the class namespace to avoid hasattr walking the MRO again
+    if not class_type.__dict__.get('__abstractmethods__'):
+        return False
+    
+    if class_type in direct_bases:
+        return True
+    
+    # Convention: interface names start with 'I' followed by at least one character
+    name = class_type.__name__
+    return len(name) > 1 and name[0] == 'I'
 
 
 class AnnotationInterfaceStrategy(InterfaceDetectionStrategy):
@@ -91,7 +96,7 @@ class AnnotationInterfaceStrategy(InterfaceDetectionStrategy):
         """
         self._interface_marker = interface_marker
     
-    def get_interfaces(self, service_class: Type[BaseService]) -> List[Type]:
+    def get_interfaces(self, service_class: Type[BaseService]) -> Sequence[Type]:
         """Get interfaces based on explicit annotation."""
         if hasattr(service_class, self._interface_marker):
             return getattr(service_class, self._interface_marker)
@@ -130,39 +135,18 @@ class InterfaceRegistrationManager(IInterfaceManager):
         """
         try:
             interfaces = self._detection_strategy.get_interfaces(service_class)
+            if not interfaces:
+                return True
             
-            success_count = 0
-            for interface in interfaces:
-                if self._register_single_interface(interface, service_instance):
-                    success_count += 1
-            
-            if interfaces:
-                logger.info(f"Registered {success_count}/{len(interfaces)} interfaces for {service_class.__name__}")
-            
-            return success_count == len(interfaces) if interfaces else True
-            
-        except Exception as e:
-            logger.error(f"Failed to register interfaces for {service_class.__name__}: {e}")
-            return False
-    
-    def _register_single_interface(self, interface: Type, 
-                                 service_instance: BaseService) -> bool:
-        """
-        Register a single interface with the container.
-        
-        Args:
-            interface: Interface type to register
-            service_instance: Service instance
-            
-        Returns:
-            True if registration successful
-        """
-        try:
-            self._container.register_instance(interface, service_instance)
-            logger.debug(f"Registered interface {interface.__name__} for {service_instance.__class__.__name__}")
+            self._container.register_instances(
+                [(interface, service_instance) for interface in interfaces]
+            )
+            logger.info("Registered %d interfaces for %s",
+                        len(interfaces), service_class.__name__)
             return True
+            
         except Exception as e:
-            logger.warning(f"Could not register interface {interface.__name__}: {e}")
+            logger.error("Failed to register interfaces for %s: %s", service_class.__name__, e)
             return False
 
 
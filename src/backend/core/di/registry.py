@@ -4,10 +4,12 @@ Handles service registration, discovery, and feature lifecycle management.
 """
 
 import importlib
-import inspect
 import re
+import sys
 import logging
-from typing import Dict, Type, Optional, List, Tuple, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Type, Optional, List, Tuple, Any, Sequence, Mapping, Set, Hashable
 from datetime import datetime
 from abc import ABC, abstractmethod
 
@@ -18,17 +20,90 @@ from .singleton_factory import get_singleton_registry, create_singleton_factory
 from .service_detector import IServiceDetector, ServiceDetectorFactory
 from .interface_manager import IInterfaceManager, InterfaceManagerFactory
 from ..constants import ServiceConstants, ContainerConstants, LoggingConstants
+from ..web.routes import BaseRoutes
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _service_mod_name(module_path: str) -> str:
+    """Get the dotted path of a feature's service module."""
+    return f"{module_path}.{ServiceConstants.SERVICE_MODULE_NAME}"
+
+
+@lru_cache(maxsize=None)
+def _routes_mod_name(module_path: str) -> str:
+    """Get the dotted path of a feature's routes module."""
+    return f"{module_path}.{ServiceConstants.ROUTES_MODULE_NAME}"
+
+
+@lru_cache(maxsize=None)
+def _service_var_name(service_name: str) -> str:
+    """Get the routes module variable name for a service."""
+    return ServiceConstants.SERVICE_VAR_PATTERN.format(service_name)
+
+
+# Service classes discovered per (module path, detector plan key)
+_discovery_plans: Dict[Tuple[str, Hashable], Tuple[Type[BaseService], ...]] = {}
+
+
+def reset_discovery_plans() -> None:
+    """Clear cached service discovery plans (mainly for testing and reloads)."""
+    _discovery_plans.clear()
+
+
+# Boundary between a lowercase letter/digit and an uppercase letter
+_CAMEL_RE = re.compile(r'([a-z0-9])([A-Z])')
+
+
+# Imported modules and missing submodules, keyed by dotted path
+_import_cache: Dict[str, Any] = {}
+
+
+def _cached_import(dotted_path: str) -> Any:
+    """
+    Import a module once, memoizing hits and submodules that do not exist.
+    
+    Import errors raised from inside an existing module (e.g. a missing
+    dependency) are returned but not cached, so a later call retries.
+    
+    Args:
+        dotted_path: Fully qualified module path
+        
+    Returns:
+        The imported module, or the ImportError if it cannot be imported
+    """
+    module = _import_cache.get(dotted_path)
+    if module is not None:
+        return module
+    
+    module = sys.modules.get(dotted_path)
+    if module is None:
+        try:
+            module = importlib.import_module(dotted_path)
+        except ImportError as e:
+            if e.name == dotted_path:
+                # The submodule itself is absent; drop frames before caching the miss
+                e.__traceback__ = None
+                _import_cache[dotted_path] = e
+            return e
+    
+    _import_cache[dotted_path] = module
+    return module
+
+
 class ServiceRegistry:
     """Registry for managing application services."""
     
+    __slots__ = ('_services', '_services_view', '_container', '_processed_modules')
+    
     def __init__(self):
         """Initialize the service registry."""
         self._services: Dict[str, IService] = {}
+        self._services_view: Mapping[str, IService] = MappingProxyType(self._services)
         self._container = get_container()
+        # Module paths whose services were fully discovered into this registry
+        self._processed_modules: Set[str] = set()
     
     def register_service(self, service_name: str, service_instance: IService) -> bool:
         """
@@ -61,17 +136,26 @@ class ServiceRegistry:
         """
         return self._services.get(service_name)
     
-    def get_all_services(self) -> Dict[str, IService]:
-        """Get all registered services."""
-        return self._services.copy()
+    def get_all_services(self) -> Mapping[str, IService]:
+        """Get a read-only live view of all registered services."""
+        return self._services_view
     
     def service_exists(self, service_name: str) -> bool:
         """Check if a service is registered."""
         return service_name in self._services
     
+    def is_module_processed(self, module_path: str) -> bool:
+        """Check if a module's services were already discovered."""
+        return module_path in self._processed_modules
+    
+    def mark_module_processed(self, module_path: str) -> None:
+        """Record that a module's services were discovered successfully."""
+        self._processed_modules.add(module_path)
+    
     def clear(self) -> None:
         """Clear all registered services."""
         self._services.clear()
+        self._processed_modules.clear()
 
 
 class ServiceDiscovery:
@@ -80,6 +164,8 @@ class ServiceDiscovery:
     Coordinates service detection, registration, and routing setup.
     """
     
+    __slots__ = ('_registry', '_service_detector', '_interface_manager', '_route_manager')
+    
     def __init__(self, registry: ServiceRegistry, 
                  service_detector: IServiceDetector = None,
                  interface_manager: IInterfaceManager = None):
@@ -108,30 +194,51 @@ class ServiceDiscovery:
         Returns:
             True if all services discovered and registered successfully
         """
+        # Services are singletons; repeat discovery would only redo the same work
+        if self._registry.is_module_processed(module_path):
+            return True
+        
         try:
-            service_module = self._load_service_module(module_path)
-            if service_module is None:
-                return True  # Not having a service module is acceptable
-            
-            service_classes = self._service_detector.get_service_classes(service_module)
+            service_classes = self._get_discovery_plan(module_path)
             
             for service_class in service_classes:
                 if not self._register_service_class(service_class, module_path):
                     return False
             
+            self._registry.mark_module_processed(module_path)
             return True
             
         except Exception as e:
             logger.error(f"Error discovering services in {module_path}: {e}")
             return False
     
+    def _get_discovery_plan(self, module_path: str) -> Tuple[Type[BaseService], ...]:
+        """
+        Get the service classes to register for a module path.
+        
+        The first discovery of a module path scans its service module; the
+        result is kept as a plan so later discoveries (new ServiceDiscovery
+        instances, registry resets) register the same classes directly.
+        """
+        plan_key = (module_path, self._service_detector.plan_key)
+        plan = _discovery_plans.get(plan_key)
+        if plan is None:
+            service_module = self._load_service_module(module_path)
+            if service_module is None:
+                # Not having a service module is acceptable; the import cache
+                # remembers permanent misses, so import failures get retried
+                return ()
+            plan = tuple(self._service_detector.get_service_classes(service_module))
+            _discovery_plans[plan_key] = plan
+        return plan
+    
     def _load_service_module(self, module_path: str):
         """Load service module, handling import errors gracefully."""
-        try:
-            return importlib.import_module(f"{module_path}.{ServiceConstants.SERVICE_MODULE_NAME}")
-        except ImportError as e:
-            logger.warning(f"Service module not found for {module_path}: {e}")
+        module = _cached_import(_service_mod_name(module_path))
+        if isinstance(module, ImportError):
+            logger.warning("Service module not found for %s: %s", module_path, module)
             return None
+        return module
     
     def _register_service_class(self, service_class: Type[BaseService], 
                                module_path: str) -> bool:
@@ -145,7 +252,7 @@ class ServiceDiscovery:
                 return False
             
             # Get service name from class metadata
-            service_name = getattr(service_class, ServiceConstants.SERVICE_NAME_ATTRIBUTE)
+            service_name = service_class._service_name
             
             # Register service with registry
             if not self._registry.register_service(service_name, service_instance):
@@ -167,6 +274,8 @@ class ServiceDiscovery:
 class RouteManager:
     """Manages route setup and registration for services."""
     
+    __slots__ = ()
+    
     def setup_routes(self, module_path: str, service_name: str, 
                     service_instance: IService) -> None:
         """Setup routes for a service if routes module exists."""
@@ -186,49 +295,59 @@ class RouteManager:
     
     def _load_routes_module(self, module_path: str):
         """Load routes module, handling import errors gracefully."""
-        try:
-            return importlib.import_module(f"{module_path}.{ServiceConstants.ROUTES_MODULE_NAME}")
-        except ImportError:
-            return None  # Routes module might not exist
+        module = _cached_import(_routes_mod_name(module_path))
+        return None if isinstance(module, ImportError) else module  # Routes module might not exist
     
     def _register_service_with_routes(self, routes_module, service_name: str, 
                                     service_instance: IService) -> None:
         """Register service instance variable with routes module."""
-        service_var_name = ServiceConstants.SERVICE_VAR_PATTERN.format(service_name)
+        service_var_name = _service_var_name(service_name)
         setattr(routes_module, service_var_name, service_instance)
     
     def _instantiate_route_classes(self, routes_module) -> None:
         """Find and instantiate route classes to register their exposed methods with Eel."""
         try:
-            # Import BaseRoutes for type checking
-            from ..web.routes import BaseRoutes
-            
-            for name, obj in inspect.getmembers(routes_module, inspect.isclass):
-                if self._is_route_class(obj, routes_module):
-                    # Instantiate the route class - this will trigger @expose_route decorators
-                    route_instance = obj()
-                    logger.info(f"Instantiated route class: {name}")
+            for route_class in self._get_route_classes(routes_module):
+                # Instantiate the route class - this will trigger @expose_route decorators
+                route_class()
+                logger.info(f"Instantiated route class: {route_class.__name__}")
                     
         except Exception as e:
             logger.warning(f"Error instantiating route classes: {e}")
     
-    def _is_route_class(self, obj: Type, routes_module) -> bool:
-        """Check if a class is a route class."""
-        try:
-            from ..web.routes import BaseRoutes
-            return (hasattr(obj, '__module__') and 
-                    obj.__module__ == routes_module.__name__ and
-                    issubclass(obj, BaseRoutes) and
-                    obj is not BaseRoutes)
-        except ImportError:
-            return False
+    def _get_route_classes(self, routes_module) -> List[Type]:
+        """
+        Get route classes defined in a routes module.
+        
+        Walks the BaseRoutes subclass tree that Python already tracks instead
+        of reflecting over every member of the module.
+        """
+        module_name = routes_module.__name__
+        module_namespace = vars(routes_module)
+        route_classes = []
+        seen = set()
+        pending = BaseRoutes.__subclasses__()
+        
+        while pending:
+            route_class = pending.pop()
+            if route_class in seen:
+                continue
+            seen.add(route_class)
+            if (route_class.__module__ == module_name and
+                    module_namespace.get(route_class.__name__) is route_class):
+                route_classes.append(route_class)
+            pending.extend(route_class.__subclasses__())
+        
+        return route_classes
 
 
 class IFeatureManager(ABC):
     """Interface for feature management."""
     
+    __slots__ = ()
+    
     @abstractmethod
-    def register_features(self, feature_modules: List[Tuple[str, str]]) -> bool:
+    def register_features(self, feature_modules: Sequence[Tuple[str, str]]) -> bool:
         """Register application features."""
         pass
     
@@ -236,42 +355,69 @@ class IFeatureManager(ABC):
     def get_features_status(self) -> Dict[str, Any]:
         """Get status of all registered features."""
         pass
+    
+    @property
+    def generation(self) -> Optional[int]:
+        """
+        Counter bumped whenever the registered features change.
+        
+        Returns None when changes are not tracked, which disables status caching.
+        """
+        return None
 
 
 class FeatureManager(IFeatureManager):
     """Manages application features registration and status."""
     
+    __slots__ = ('_features', '_service_registry', '_generation')
+    
     def __init__(self):
         """Initialize the feature manager."""
         self._features: Dict[str, Dict[str, Any]] = {}
         self._service_registry = get_service_registry()
+        self._generation = 0
+    
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the registered features change."""
+        return self._generation
     
-    def register_features(self, feature_modules: List[Tuple[str, str]]) -> bool:
+    def register_features(self, feature_modules: Sequence[Tuple[str, str]]) -> bool:
         """
         Register application features.
         
         Args:
-            feature_modules: List of (feature_name, module_path) tuples
+            feature_modules: Sequence of (feature_name, module_path) tuples
             
         Returns:
             True if all features registered successfully
         """
         try:
+            # Features registered in one batch share a single timestamp
+            registered_at = datetime.now().isoformat()
+            batch: Dict[str, Dict[str, Any]] = {}
+            
             for feature_name, module_path in feature_modules:
-                logger.info(LoggingConstants.FEATURE_REGISTERING.format(feature_name))
+                logger.info(LoggingConstants.FEATURE_REGISTERING, feature_name)
                 
                 if auto_discover_services(module_path):
-                    self._features[feature_name] = {
+                    batch[feature_name] = {
                         'module_path': module_path,
                         'status': 'active',
-                        'registered_at': datetime.now().isoformat()
+                        'registered_at': registered_at
                     }
-                    logger.info(LoggingConstants.FEATURE_SUCCESS.format(feature_name))
+                    logger.info(LoggingConstants.FEATURE_SUCCESS, feature_name)
                 else:
-                    logger.error(LoggingConstants.FEATURE_FAILED.format(feature_name))
+                    logger.error(LoggingConstants.FEATURE_FAILED, feature_name)
+                    # Keep the features that did register before the failure
+                    self._features.update(batch)
+                    self._generation += 1
                     return False
             
-            logger.info(LoggingConstants.FEATURES_REGISTERED.format(list(self._features.keys())))
+            self._features.update(batch)
+            self._generation += 1
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(LoggingConstants.FEATURES_REGISTERED, list(self._features))
             return True
             
         except Exception as e:
@@ -312,7 +458,7 @@ def Service(name: Optional[str] = None):
 
 def _camel_to_snake(camel_str: str) -> str:
     """Convert CamelCase to snake_case."""
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', camel_str).lower()
+    return _CAMEL_RE.sub(r'\1_\2', camel_str).lower()
 
 
 # Initialize singleton factory for service registry
@@ -3,19 +3,36 @@ Service detection and validation utilities.
 Handles service class discovery and validation logic.
 """
 
-import inspect
 import logging
-from typing import Type, List, Any
+from typing import Type, List, Any, Tuple, Hashable
 from abc import ABC, abstractmethod
 
 from ..services.base import BaseService
 
 logger = logging.getLogger(__name__)
 
+def get_module_classes(module: Any) -> List[Tuple[str, Type]]:
+    """
+    Get (name, class) pairs defined or imported in a module.
+    
+    Reads the module namespace directly; discovery plans already ensure
+    each feature module is only scanned once.
+    
+    Args:
+        module: Python module to scan
+        
+    Returns:
+        List of (name, class) pairs in namespace order
+    """
+    return [(name, obj) for name, obj in list(vars(module).items())
+            if isinstance(obj, type)]
+
 
 class IServiceDetector(ABC):
     """Interface for service detection strategies."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def is_service_class(self, obj: Type) -> bool:
         """Check if a class is a service class."""
@@ -25,6 +42,15 @@ class IServiceDetector(ABC):
     def get_service_classes(self, module: Any) -> List[Type[BaseService]]:
         """Get all service classes from a module."""
         pass
+    
+    @property
+    def plan_key(self) -> Hashable:
+        """
+        Key identifying this detector's configuration for discovery plan caching.
+        
+        Detectors with settings that affect detection must include them.
+        """
+        return type(self)
 
 
 class BaseServiceDetector(IServiceDetector):
@@ -33,17 +59,15 @@ class BaseServiceDetector(IServiceDetector):
     Detects services based on BaseService inheritance and naming conventions.
     """
     
-    def __init__(self):
-        """Initialize the service detector."""
-        self._service_criteria = [
-            self._inherits_from_base_service,
-            self._is_not_base_service_itself,
-            self._has_service_name_attribute
-        ]
+    __slots__ = ()
     
     def is_service_class(self, obj: Type) -> bool:
         """
-        Check if a class is a service class using configurable criteria.
+        Check if a class is a service class.
+        
+        A service class inherits from BaseService, is not BaseService itself
+        and carries the service name attribute set by @Service. Checks are
+        ordered cheapest first so most candidates short-circuit early.
         
         Args:
             obj: Class to check
@@ -51,10 +75,10 @@ class BaseServiceDetector(IServiceDetector):
         Returns:
             True if class meets all service criteria
         """
-        if not inspect.isclass(obj):
-            return False
-        
-        return all(criterion(obj) for criterion in self._service_criteria)
+        return (isinstance(obj, type) and
+                obj is not BaseService and
+                issubclass(obj, BaseService) and
+                hasattr(obj, '_service_name'))
     
     def get_service_classes(self, module: Any) -> List[Type[BaseService]]:
         """
@@ -67,25 +91,15 @@ class BaseServiceDetector(IServiceDetector):
             List of service classes found in the module
         """
         service_classes = []
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        for name, obj in inspect.getmembers(module, inspect.isclass):
+        for name, obj in get_module_classes(module):
             if self.is_service_class(obj):
                 service_classes.append(obj)
-                logger.debug(f"Detected service class: {name}")
+                if debug_enabled:
+                    logger.debug("Detected service class: %s", name)
         
         return service_classes
-    
-    def _inherits_from_base_service(self, obj: Type) -> bool:
-        """Check if class inherits from BaseService."""
-        return issubclass(obj, BaseService)
-    
-    def _is_not_base_service_itself(self, obj: Type) -> bool:
-        """Check if class is not BaseService itself."""
-        return obj is not BaseService
-    
-    def _has_service_name_attribute(self, obj: Type) -> bool:
-        """Check if class has service name attribute."""
-        return hasattr(obj, '_service_name')
 
 
 class AnnotationBasedServiceDetector(IServiceDetector):
@@ -94,6 +108,8 @@ class AnnotationBasedServiceDetector(IServiceDetector):
     More flexible approach for future extensibility.
     """
     
+    __slots__ = ('_service_annotation',)
+    
     def __init__(self, service_annotation: str = '_service_name'):
         """
         Initialize annotation-based detector.
@@ -103,16 +119,21 @@ class AnnotationBasedServiceDetector(IServiceDetector):
         """
         self._service_annotation = service_annotation
     
+    @property
+    def plan_key(self) -> Hashable:
+        """Key including the annotation, since it changes which classes match."""
+        return (type(self), self._service_annotation)
+    
     def is_service_class(self, obj: Type) -> bool:
         """Check if class has service annotation."""
-        return (inspect.isclass(obj) and 
+        return (isinstance(obj, type) and 
                 hasattr(obj, self._service_annotation) and
                 issubclass(obj, BaseService) and
                 obj is not BaseService)
     
     def get_service_classes(self, module: Any) -> List[Type[BaseService]]:
         """Get annotated service classes from module."""
-        return [obj for name, obj in inspect.getmembers(module, inspect.isclass)
+        return [obj for name, obj in get_module_classes(module)
                 if self.is_service_class(obj)]
 
 
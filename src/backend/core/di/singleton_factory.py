@@ -3,6 +3,7 @@ Generic singleton factory pattern.
 Eliminates code duplication for global instance management.
 """
 
+import threading
 from typing import TypeVar, Generic, Optional, Callable, Type, Dict, Any
 from abc import ABC, abstractmethod
 
@@ -12,6 +13,8 @@ T = TypeVar('T')
 class ISingletonFactory(ABC, Generic[T]):
     """Interface for singleton factory implementations."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def get_instance(self) -> T:
         """Get or create singleton instance."""
@@ -29,6 +32,8 @@ class SingletonFactory(ISingletonFactory[T]):
     Provides thread-safe singleton management with lazy initialization.
     """
     
+    __slots__ = ('_factory_func', '_instance', '_lock')
+    
     def __init__(self, factory_func: Callable[[], T]):
         """
         Initialize singleton factory.
@@ -38,13 +43,18 @@ class SingletonFactory(ISingletonFactory[T]):
         """
         self._factory_func = factory_func
         self._instance: Optional[T] = None
-        self._lock = None  # We'll use threading.Lock in production
+        self._lock = threading.Lock()
     
     def get_instance(self) -> T:
-        """Get or create singleton instance with lazy initialization."""
-        if self._instance is None:
-            self._instance = self._factory_func()
-        return self._instance
+        """Get or create singleton instance with double-checked locking."""
+        instance = self._instance
+        if instance is not None:
+            return instance
+        
+        with self._lock:
+            if self._instance is None:
+                self._instance = self._factory_func()
+            return self._instance
     
     def reset_instance(self) -> None:
         """Reset singleton instance (mainly for testing)."""
@@ -57,6 +67,8 @@ class SingletonRegistry:
     Centralized singleton management across the application.
     """
     
+    __slots__ = ('_factories',)
+    
     def __init__(self):
         """Initialize the singleton registry."""
         self._factories: Dict[str, ISingletonFactory] = {}
@@ -71,6 +83,24 @@ class SingletonRegistry:
         """
         self._factories[name] = factory
     
+    def get_or_register_factory(self, name: str, 
+                                factory_func: Callable[[], Any]) -> ISingletonFactory:
+        """
+        Get a singleton factory, registering a new one if absent.
+        
+        Args:
+            name: Unique name for the factory
+            factory_func: Function to create instances if a factory is registered
+            
+        Returns:
+            The registered singleton factory
+        """
+        factory = self._factories.get(name)
+        if factory is None:
+            # setdefault is atomic, so concurrent first callers share one factory
+            factory = self._factories.setdefault(name, SingletonFactory(factory_func))
+        return factory
+    
     def get_instance(self, name: str) -> Any:
         """
         Get singleton instance by factory name.
@@ -84,10 +114,11 @@ class SingletonRegistry:
         Raises:
             KeyError: If factory not registered
         """
-        if name not in self._factories:
+        factory = self._factories.get(name)
+        if factory is None:
             raise KeyError(f"Singleton factory '{name}' not registered")
         
-        return self._factories[name].get_instance()
+        return factory.get_instance()
     
     def reset_instance(self, name: str) -> None:
         """
@@ -96,8 +127,9 @@ class SingletonRegistry:
         Args:
             name: Factory name
         """
-        if name in self._factories:
-            self._factories[name].reset_instance()
+        factory = self._factories.get(name)
+        if factory is not None:
+            factory.reset_instance()
     
     def reset_all(self) -> None:
         """Reset all singleton instances."""
@@ -105,15 +137,12 @@ class SingletonRegistry:
             factory.reset_instance()
 
 
-# Global registry instance
-_global_registry: Optional[SingletonRegistry] = None
+# Global registry instance, created once under the import lock
+_global_registry: SingletonRegistry = SingletonRegistry()
 
 
 def get_singleton_registry() -> SingletonRegistry:
     """Get the global singleton registry."""
-    global _global_registry
-    if _global_registry is None:
-        _global_registry = SingletonRegistry()
     return _global_registry
 
 
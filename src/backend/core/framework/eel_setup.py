@@ -3,9 +3,10 @@ Eel framework configuration and setup.
 Handles Eel initialization, configuration, and application server setup.
 """
 
-import eel
 import logging
 from abc import ABC, abstractmethod
+from functools import lru_cache
+from typing import Any, Callable, Dict
 
 from ...config.app_settings import AppSettings
 from ..constants import LoggingConstants
@@ -13,9 +14,23 @@ from ..constants import LoggingConstants
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=4)
+def _build_start_args(mode: str, host: str, port: int,
+                      close_callback: Callable) -> Dict[str, Any]:
+    """Build the Eel start arguments once per server configuration."""
+    return {
+        'mode': mode,
+        'host': host,
+        'port': port,
+        'close_callback': close_callback
+    }
+
+
 class IEelConfigurator(ABC):
     """Interface for Eel framework configuration."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def configure_eel(self, settings: AppSettings) -> None:
         """Configure Eel with application settings."""
@@ -25,6 +40,8 @@ class IEelConfigurator(ABC):
 class EelConfigurator(IEelConfigurator):
     """Handles Eel framework configuration and setup."""
     
+    __slots__ = ()
+    
     def configure_eel(self, settings: AppSettings) -> None:
         """
         Configure Eel framework with application settings.
@@ -32,12 +49,16 @@ class EelConfigurator(IEelConfigurator):
         Args:
             settings: Application settings instance containing server configuration
         """
-        eel._start_args = {
-            'mode': settings.server.mode,
-            'host': settings.server.host,
-            'port': settings.server.port,
-            'close_callback': self._on_app_close
-        }
+        # Deferred so the DI graph can be built without loading eel's server stack
+        import eel
+        from ..web.api import expose_endpoints
+        
+        expose_endpoints()
+        server = settings.server
+        start_args = _build_start_args(server.mode, server.host, server.port,
+                                       self._on_app_close)
+        # Merge into Eel's own dict so the cached one is never mutated by eel.start()
+        eel._start_args.update(start_args)
         
         logger.info(LoggingConstants.EEL_CONFIGURED)
     
@@ -9,6 +9,8 @@ from abc import ABC, abstractmethod
 class IService(ABC):
     """Interface for all application services."""
     
+    __slots__ = ()
+    
     @abstractmethod
     def initialize(self) -> bool:
         """Initialize the service."""
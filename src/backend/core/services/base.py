@@ -4,16 +4,33 @@ Provides common functionality and interface for all feature services.
 """
 
 import logging
+from functools import lru_cache
 from typing import Optional, Type, TypeVar
 from ..interfaces import IService
 from ..constants import ErrorCodes, LoggingConstants, ValidationConstants
 
 T = TypeVar('T')
 
+# Types whose zero-length values count as empty input
+_SIZED_TYPES = (str, bytes, list, dict, tuple, set)
+
+
+def _is_empty(data: object) -> bool:
+    """Check for missing or zero-length input; 0 and False are valid values."""
+    return data is None or (isinstance(data, _SIZED_TYPES) and len(data) == 0)
+
+
+@lru_cache(maxsize=64)
+def _type_error(expected_type: type) -> str:
+    """Get the invalid-type message for a type, formatted once."""
+    return ValidationConstants.INVALID_TYPE_ERROR.format(expected_type.__name__)
+
 
 class BaseService(IService):
     """Base implementation for all feature services."""
     
+    __slots__ = ('_feature_name', '_logger', '_is_initialized')
+    
     def __init__(self, feature_name: str = None):
         """
         Initialize the base service.
@@ -59,10 +76,10 @@ class BaseService(IService):
         try:
             self._initialize_specific()
             self._is_initialized = True
-            self._logger.info(LoggingConstants.SERVICE_INIT_SUCCESS.format(self._feature_name))
+            self._logger.info(LoggingConstants.SERVICE_INIT_SUCCESS, self._feature_name)
             return True
         except Exception as e:
-            self._logger.error(LoggingConstants.SERVICE_INIT_FAILED.format(self._feature_name, e))
+            self._logger.error(LoggingConstants.SERVICE_INIT_FAILED, self._feature_name, e)
             return False
     
     def _initialize_specific(self) -> None:
@@ -77,15 +94,15 @@ class BaseService(IService):
         Args:
             data: Data to validate
             expected_type: Expected type
-            allow_empty: Whether to allow empty values
+            allow_empty: Whether to allow None or zero-length values
             
         Returns:
             Error message if validation fails, None if valid
         """
-        if not allow_empty and not data:
+        if not allow_empty and _is_empty(data):
             return ValidationConstants.EMPTY_INPUT_ERROR
         
         if data is not None and not isinstance(data, expected_type):
-            return ValidationConstants.INVALID_TYPE_ERROR.format(expected_type.__name__)
+            return _type_error(expected_type)
         
         return None 
\ No newline at end of file
@@ -3,9 +3,8 @@ Web API layer for application endpoints.
 Handles HTTP/Eel layer interactions and delegates to application services.
 """
 
-import eel
 import logging
-from typing import Dict, Any, TYPE_CHECKING
+from typing import Dict, Any, Optional, TYPE_CHECKING
 
 from .responses import ResponseHandler
 from ..constants import LoggingConstants, ErrorCodes, ContainerConstants
@@ -21,6 +20,8 @@ logger = logging.getLogger(__name__)
 class WebAPI:
     """Web API layer for exposing application functionality via Eel."""
     
+    __slots__ = ('_application', '_cached_response', '_cached_generation')
+    
     def __init__(self, application: 'Application' = None):
         """
         Initialize the web API layer.
@@ -29,6 +30,8 @@ class WebAPI:
             application: Application instance
         """
         self._application = application or self._create_application()
+        self._cached_response: Optional[Dict[str, Any]] = None
+        self._cached_generation: Optional[int] = None
     
     def _create_application(self) -> 'Application':
         """Create an application instance using lazy import to avoid circular dependencies."""
@@ -38,15 +41,23 @@ class WebAPI:
     def get_application_status(self) -> Dict[str, Any]:
         """Get comprehensive application and features status."""
         try:
-            if not self._application.is_initialized:
+            app = self._application
+            if not app.is_initialized:
                 return ResponseHandler.error(
                     "Application not initialized",
                     ErrorCodes.CONTROLLER_NOT_INITIALIZED
                 )
             
-            status = self._application.get_status()
+            # Status only changes when features do; reuse the last response until then
+            generation = app.feature_manager.generation
+            if generation is not None and generation == self._cached_generation:
+                return self._cached_response
+            
+            response = ResponseHandler.success(app.get_status())
             logger.info(LoggingConstants.STATUS_RETRIEVED)
-            return ResponseHandler.success(status)
+            self._cached_response = response
+            self._cached_generation = generation
+            return response
             
         except Exception as e:
             error_msg = f"Error getting application status: {str(e)}"
@@ -65,12 +76,25 @@ def get_web_api() -> WebAPI:
 
 
 # Eel exposed endpoints
-@eel.expose
 def get_features_status() -> Dict[str, Any]:
     """Get status of all registered features and application state."""
     return get_web_api().get_application_status()
 
 
+_endpoints_exposed = False
+
+
+def expose_endpoints() -> None:
+    """Expose web API endpoints to Eel; safe to call more than once."""
+    global _endpoints_exposed
+    if _endpoints_exposed:
+        return
+    
+    import eel
+    eel.expose(get_features_status)
+    _endpoints_exposed = True
+
+
 def reset_web_api() -> None:
     """Reset the global web API instance (mainly for testing)."""
     get_singleton_registry().reset_instance(ContainerConstants.WEB_API_REGISTRY_NAME) 
\ No newline at end of file
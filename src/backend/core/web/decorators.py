@@ -27,12 +27,16 @@ class RouteDecorators:
         Returns:
             Decorated function with automatic initialization check
         """
+        # Resolve the module service once; modules often bind it after decoration
+        service = RouteDecorators._get_service_from_module(func)
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            service = RouteDecorators._get_service_from_module(func)
-            
-            if not service:
-                return ResponseHandler.service_not_found("Unknown")
+            nonlocal service
+            if service is None:
+                service = RouteDecorators._get_service_from_module(func)
+                if service is None:
+                    return ResponseHandler.service_not_found("Unknown")
             
             if not service.is_initialized:
                 return ResponseHandler.service_not_initialized(service.feature_name)
@@ -81,9 +85,11 @@ class RouteDecorators:
         """
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            logger.info(f"Route {func.__name__} called with args: {args}, kwargs: {kwargs}")
+            if not logger.isEnabledFor(logging.INFO):
+                return func(*args, **kwargs)
+            logger.info("Route %s called with args: %s, kwargs: %s", func.__name__, args, kwargs)
             result = func(*args, **kwargs)
-            logger.info(f"Route {func.__name__} completed")
+            logger.info("Route %s completed", func.__name__)
             return result
         
         return wrapper
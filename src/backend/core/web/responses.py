@@ -3,13 +3,33 @@ Response handling utilities.
 Provides standardized response creation and error handling for web layer.
 """
 
+from functools import lru_cache
 from typing import Dict, Any, Optional
 from ..constants import ErrorCodes, ResponseConstants
 
 
+_SERVICE_ERROR_MESSAGES: Dict[ErrorCodes, str] = {
+    ErrorCodes.SERVICE_NOT_INITIALIZED: "service not initialized",
+    ErrorCodes.SERVICE_NOT_FOUND: "service not found",
+}
+
+
+@lru_cache(maxsize=128)
+def _service_error(service_name: str, error_code: ErrorCodes) -> Dict[str, Any]:
+    """Build a service error response once per (service_name, code) pair."""
+    return {
+        ResponseConstants.SUCCESS_KEY: False,
+        ResponseConstants.ERROR_KEY: f"{service_name} {_SERVICE_ERROR_MESSAGES[error_code]}",
+        ResponseConstants.CODE_KEY: error_code.value
+    }
+
+
 class ResponseHandler:
     """Centralized response handler for consistent API responses."""
     
+    # Template for data-less success responses; handed out as copies
+    _SUCCESS_EMPTY: Dict[str, Any] = {ResponseConstants.SUCCESS_KEY: True}
+    
     @staticmethod
     def success(data: Any = None) -> Dict[str, Any]:
         """
@@ -21,10 +41,9 @@ class ResponseHandler:
         Returns:
             Standardized success response
         """
-        response = {ResponseConstants.SUCCESS_KEY: True}
-        if data is not None:
-            response[ResponseConstants.DATA_KEY] = data
-        return response
+        if data is None:
+            return ResponseHandler._SUCCESS_EMPTY.copy()
+        return {ResponseConstants.SUCCESS_KEY: True, ResponseConstants.DATA_KEY: data}
     
     @staticmethod
     def error(message: str, error_code: ErrorCodes, data: Any = None) -> Dict[str, Any]:
@@ -59,10 +78,7 @@ class ResponseHandler:
         Returns:
             Service not initialized error response
         """
-        return ResponseHandler.error(
-            f"{service_name} service not initialized",
-            ErrorCodes.SERVICE_NOT_INITIALIZED
-        )
+        return _service_error(service_name, ErrorCodes.SERVICE_NOT_INITIALIZED).copy()
     
     @staticmethod
     def service_not_found(service_name: str) -> Dict[str, Any]:
@@ -75,10 +91,7 @@ class ResponseHandler:
         Returns:
             Service not found error response
         """
-        return ResponseHandler.error(
-            f"{service_name} service not found",
-            ErrorCodes.SERVICE_NOT_FOUND
-        )
+        return _service_error(service_name, ErrorCodes.SERVICE_NOT_FOUND).copy()
     
     @staticmethod
     def unexpected_error(message: str) -> Dict[str, Any]:
@@ -3,48 +3,83 @@ Base route classes for building API endpoints with dependency injection.
 Provides common functionality and structure for feature-specific route implementations.
 """
 
-import eel
+import inspect
 import logging
-from typing import Dict, Any, Optional, Type, TypeVar, get_type_hints
-from functools import wraps
+from functools import lru_cache
+from typing import Dict, Any, Optional, Type, TypeVar, List, Tuple, get_type_hints
 
 from ..di.container import get_container
 from ..interfaces import IService
 from ..constants import RouteConstants
-from ..web.decorators import handle_exceptions, log_route_call
+from .responses import ResponseHandler
 
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T', bound=IService)
 
 
+@lru_cache(maxsize=256)
+def _derive_service_name(attr_name: str, interface_name: str) -> str:
+    """Derive a service name from an attribute name or interface name."""
+    # Try to derive from attribute name first
+    service_name = attr_name.replace('_service', '').replace('service', '')
+    
+    # If that doesn't work, derive from interface name
+    if not service_name or service_name == attr_name:
+        # Remove 'I' prefix and 'Service' suffix
+        if interface_name.startswith('I'):
+            interface_name = interface_name[1:]
+        if interface_name.endswith('Service'):
+            interface_name = interface_name[:-7]
+        service_name = interface_name.lower()
+    
+    return service_name
+
+
 class BaseRoutes:
     """
     Base class for all route implementations.
     Provides dependency injection and common route functionality with automatic service injection.
     """
     
+    # Injection plan of (attr_name, attr_type, service_name), built per subclass
+    __injection_plan__: Optional[List[Tuple[str, Type, str]]] = None
+    
+    # Names of @expose_route methods, collected per subclass
+    __route_names__: Tuple[str, ...] = ()
+    
+    def __init_subclass__(cls, **kwargs):
+        """Resolve the injection plan and exposed routes once when a subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        cls.__route_names__ = cls._collect_route_names()
+        try:
+            cls.__injection_plan__ = cls._build_injection_plan()
+        except NameError:
+            # Forward references not resolvable yet; build on first instantiation
+            cls.__injection_plan__ = None
+    
     def __init__(self):
         """Initialize the base routes with automatic dependency injection."""
         self._container = get_container()
-        self._services: Dict[str, IService] = {}
         self._auto_inject_dependencies()
         self._expose_routes_to_eel()
     
-    def _auto_inject_dependencies(self) -> None:
+    @classmethod
+    def _build_injection_plan(cls) -> List[Tuple[str, Type, str]]:
         """
-        Automatically inject dependencies based on type annotations.
-        FAIL FAST approach: If injection fails, application startup should fail.
+        Collect the service attributes to inject from the class type annotations.
+        
+        Services are attributes whose type implements an interface (detected by
+        'interfaces' in module name, or an I...Service type name).
         
-        Scans class type annotations and automatically injects services
-        that implement interfaces (detected by 'interfaces' in module name).
+        Returns:
+            List of (attr_name, attr_type, service_name) tuples
         """
-        hints = get_type_hints(self.__class__)
-        required_services = []
+        plan = []
         
-        for attr_name, attr_type in hints.items():
-            # Skip built-in types and non-service attributes
-            if not hasattr(attr_type, '__module__'):
+        for attr_name, attr_type in cls._get_annotations().items():
+            # Skip typing constructs and other non-class annotations
+            if not isinstance(attr_type, type):
                 continue
                 
             # Check if this is likely a service interface
@@ -52,24 +87,61 @@ class BaseRoutes:
                 attr_type.__name__.startswith('I') and attr_type.__name__.endswith('Service')):
                 
                 # Derive service name from attribute name or interface name
-                service_name = self._derive_service_name(attr_name, attr_type)
-                required_services.append((attr_name, attr_type, service_name))
-                
-                # Inject the service - FAIL FAST if not available
-                service = self._inject_service(attr_type, service_name)
-                if service is None:
-                    raise ValueError(
-                        f"Failed to inject required service '{service_name}' for {self.__class__.__name__}. "
-                        f"Ensure the service is properly registered in the DI container."
-                    )
-                
-                setattr(self, attr_name, service)
-                logger.debug(f"Auto-injected {attr_name}: {attr_type.__name__}")
+                service_name = cls._derive_service_name(attr_name, attr_type)
+                plan.append((attr_name, attr_type, service_name))
+        
+        return plan
+    
+    @classmethod
+    def _get_annotations(cls) -> Dict[str, Any]:
+        """
+        Collect class annotations across the route class hierarchy.
+        
+        Reads each class's own annotations without evaluating them and only
+        falls back to get_type_hints when a forward reference string must be
+        evaluated.
+        
+        Returns:
+            Mapping of attribute name to annotated type
+        """
+        annotations: Dict[str, Any] = {}
+        for klass in reversed(cls.__mro__):
+            annotations.update(inspect.get_annotations(klass))
+        
+        if any(isinstance(attr_type, str) for attr_type in annotations.values()):
+            return get_type_hints(cls)
+        return annotations
+    
+    def _auto_inject_dependencies(self) -> None:
+        """
+        Automatically inject dependencies based on type annotations.
+        FAIL FAST approach: If injection fails, application startup should fail.
+        
+        Iterates the injection plan precomputed for the class, so instances
+        only resolve and assign their services.
+        """
+        cls = self.__class__
+        required_services = cls.__injection_plan__
+        if required_services is None:
+            required_services = cls.__injection_plan__ = cls._build_injection_plan()
+        
+        for attr_name, attr_type, service_name in required_services:
+            # Inject the service - FAIL FAST if not available
+            service = self._inject_service(attr_type, service_name)
+            if service is None:
+                raise ValueError(
+                    f"Failed to inject required service '{service_name}' for {cls.__name__}. "
+                    f"Ensure the service is properly registered in the DI container."
+                )
+            
+            setattr(self, attr_name, service)
+            logger.debug("Auto-injected %s: %s", attr_name, attr_type.__name__)
         
         if required_services:
-            logger.info(f"Successfully injected {len(required_services)} services for {self.__class__.__name__}")
+            logger.info("Successfully injected %d services for %s", len(required_services), cls.__name__)
     
-    def _derive_service_name(self, attr_name: str, attr_type: Type) -> str:
+    @classmethod
+    def _derive_service_name(cls, attr_name: str, attr_type: Type) -> str:
         """
         Derive service name from attribute name or type.
         
@@ -80,62 +152,76 @@ class BaseRoutes:
         Returns:
             Derived service name for container lookup
         """
-        # Try to derive from attribute name first
-        service_name = attr_name.replace('_service', '').replace('service', '')
+        return _derive_service_name(attr_name, attr_type.__name__)
+    
+    @classmethod
+    def _collect_route_names(cls) -> Tuple[str, ...]:
+        """
+        Collect the names of methods marked with @expose_route.
+        
+        Scans the namespaces of route classes and mixins, skipping only
+        BaseRoutes and object, so overridden methods are seen once and
+        inherited routes are kept.
+        
+        Returns:
+            Route method names in definition order
+        """
+        exposure_attribute = RouteConstants.EEL_EXPOSURE_ATTRIBUTE
+        seen = set()
+        route_names = []
         
-        # If that doesn't work, derive from interface name
-        if not service_name or service_name == attr_name:
-            interface_name = attr_type.__name__
-            # Remove 'I' prefix and 'Service' suffix
-            if interface_name.startswith('I'):
-                interface_name = interface_name[1:]
-            if interface_name.endswith('Service'):
-                interface_name = interface_name[:-7]
-            service_name = interface_name.lower()
+        for klass in cls.__mro__:
+            # Mixins may follow BaseRoutes in the MRO, so skip rather than stop
+            if klass is BaseRoutes or klass is object:
+                continue
+            for name, attr in vars(klass).items():
+                if name in seen:
+                    continue
+                seen.add(name)
+                
+                # Check if the function was decorated with @expose_route
+                if getattr(attr, exposure_attribute, False):
+                    route_names.append(name)
         
-        return service_name
+        return tuple(route_names)
     
     def _expose_routes_to_eel(self) -> None:
         """Expose methods marked with @expose_route to Eel."""
-        import inspect
+        import eel
         
-        for name, method in inspect.getmembers(self, predicate=inspect.ismethod):
-            # Check if the method was decorated with @expose_route
-            if hasattr(method, RouteConstants.EEL_EXPOSURE_ATTRIBUTE) and getattr(method, RouteConstants.EEL_EXPOSURE_ATTRIBUTE):
-                # Get the original function name for Eel exposure
-                func_name = getattr(method, '__name__', name)
-                
-                # Expose the bound method to Eel
-                eel.expose(method)
-                logger.debug(f"Exposed route method '{func_name}' from {self.__class__.__name__}")
+        for name in self.__route_names__:
+            # Expose the bound method; Eel calls it directly without extra wrapping
+            eel.expose(getattr(self, name))
+            logger.debug("Exposed route method '%s' from %s", name, self.__class__.__name__)
     
     def _inject_service(self, service_type: Type[T], service_name: str) -> Optional[T]:
         """
         Inject a service dependency with FAIL FAST approach.
         
+        The container already holds services as singletons, so the resolved
+        instance is returned directly without a per-route cache.
+        
         Args:
             service_type: The service interface type
-            service_name: Name of the service for caching
+            service_name: Name of the service for error reporting
             
         Returns:
             Service instance or None if not available
         """
-        if service_name not in self._services:
-            try:
-                service = self._container.resolve(service_type)
-                
-                # Verify service is properly initialized
-                if not service.is_initialized:
-                    raise ValueError(f"Service '{service_name}' is not properly initialized")
-                
-                self._services[service_name] = service
-                logger.debug(f"Injected service: {service_name}")
-            except Exception as e:
-                logger.error(f"Service injection failed for '{service_name}': {e}")
-                return None
-                
-        return self._services[service_name]
-
+        try:
+            service = self._container.resolve(service_type)
+        except Exception as e:
+            logger.error("Service injection failed for '%s': %s", service_name, e)
+            return None
+        
+        # Verify service is properly initialized
+        if not service.is_initialized:
+            logger.error("Service injection failed for '%s': service is not properly initialized",
+                         service_name)
+            return None
+        
+        logger.debug("Injected service: %s", service_name)
+        return service
 
 def expose_route(func):
     """
@@ -145,17 +231,32 @@ def expose_route(func):
         func: The method to expose
         
     Returns:
-        Decorated method with Eel exposure and common decorators
+        Decorated method with Eel exposure, call logging and exception handling
     """
     # Mark the function as needing Eel exposure
     setattr(func, RouteConstants.EEL_EXPOSURE_ATTRIBUTE, True)
     
-    @handle_exceptions
-    @log_route_call
-    @wraps(func)
+    name = func.__name__
+    
+    # Logging and exception handling fused into one frame per Eel call
     def wrapper(*args, **kwargs):
-        return func(*args, **kwargs)
+        log_enabled = logger.isEnabledFor(logging.INFO)
+        if log_enabled:
+            logger.info("Route %s called with args: %s, kwargs: %s", name, args, kwargs)
+        try:
+            result = func(*args, **kwargs)
+        except Exception as e:
+            error_msg = f"Unexpected error in {name}: {str(e)}"
+            logger.error(error_msg, exc_info=True)
+            return ResponseHandler.unexpected_error(error_msg)
+        if log_enabled:
+            logger.info("Route %s completed", name)
+        return result
     
+    # Copy only the metadata Eel exposure and logging rely on
+    wrapper.__name__ = name
+    wrapper.__qualname__ = func.__qualname__
+    wrapper.__doc__ = func.__doc__
     setattr(wrapper, RouteConstants.EEL_EXPOSURE_ATTRIBUTE, True)
     setattr(wrapper, RouteConstants.ORIGINAL_FUNC_ATTRIBUTE, func)
-    return wrapper 
\ No newline at end of file
+    return wrapper
@@ -3,7 +3,6 @@ Health feature API routes.
 Provides Eel-exposed endpoints for health monitoring and system status using class-based architecture with dependency injection.
 """
 
-import eel
 from datetime import datetime
 from typing import Dict, Any
 
@@ -82,4 +81,4 @@ class HealthRoutes(BaseRoutes):
                 "timestamp": datetime.now().isoformat(),
                 "service": "health"
             }
-        } 
\ No newline at end of file
+        }
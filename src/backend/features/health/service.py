@@ -5,13 +5,60 @@ Provides comprehensive health information about the application state.
 
 import platform
 import psutil
+import threading
 import time
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Dict, Any, List
+from functools import wraps
+from typing import Dict, Any, List, Callable, Tuple, Optional
 
-from ...core import BaseService, Service, ResponseHandler
-from ...config.constants import ErrorCodes
+from ...core import BaseService, Service, ResponseHandler, ErrorCodes
+
+# Seconds a sampled metric is reused before the system is queried again
+METRIC_CACHE_TTL_SECONDS = 1.0
+
+# Seconds a full health status response is served from cache
+HEALTH_STATUS_CACHE_TTL_SECONDS = 2.0
+
+# Shared pool so independent health probes run concurrently; threads start lazily
+_HEALTH_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="health-check")
+
+
+def _cached(ttl_seconds: float) -> Callable:
+    """
+    Cache a metric method's result on the service for a short time.
+    
+    Values are stored as (expiry, value) in the service's metric cache,
+    keyed by method name, so frequent polling only samples once per TTL.
+    
+    Args:
+        ttl_seconds: How long a sampled value stays valid
+    """
+    def decorator(func: Callable) -> Callable:
+        key = func.__name__
+        
+        @wraps(func)
+        def wrapper(self):
+            now = time.monotonic()
+            entry = self._metric_cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+            value = func(self)
+            # Measure expiry from completion so slow samples still get a full TTL
+            self._metric_cache[key] = (time.monotonic() + ttl_seconds, value)
+            return value
+        
+        return wrapper
+    return decorator
+
+
+def _cpu_busy_and_total(times: Any) -> Tuple[float, float]:
+    """Split a psutil cpu_times sample into busy and total seconds."""
+    # Guest time is already included in user/nice time on Linux
+    total = sum(times) - getattr(times, 'guest', 0.0) - getattr(times, 'guest_nice', 0.0)
+    busy = total - times.idle - getattr(times, 'iowait', 0.0)
+    return busy, total
 
 
 class IHealthService(ABC):
@@ -57,27 +104,48 @@ class IHealthService(ABC):
 class HealthService(BaseService, IHealthService):
     """Service for monitoring application health and system status."""
     
+    # Health checks in report order, paired with the methods that run them
+    _HEALTH_CHECK_NAMES: Tuple[str, ...] = (
+        "system_info", "memory_usage", "disk_usage", "application_uptime", "cpu_usage"
+    )
+    _HEALTH_CHECK_METHODS: Tuple[str, ...] = (
+        "_get_system_info", "_get_memory_usage", "_get_disk_usage",
+        "_get_application_uptime", "_get_cpu_usage"
+    )
+    
     def __init__(self):
         """Initialize the health service."""
         super().__init__("health")
         self._start_time = None
-        self._health_checks = []
+        self._start_monotonic: Optional[float] = None
+        self._health_checks: Tuple[Tuple[str, Callable[[], Dict[str, Any]]], ...] = ()
+        self._metric_cache: Dict[str, Tuple[float, Any]] = {}
+        self._status_cache: Tuple[float, Any] = (0.0, None)
+        self._system_info: Optional[Dict[str, Any]] = None
+        self._cpu_counts: Optional[Tuple[int, int]] = None
+        # Previous CPU times sample, shared by every thread that reads CPU usage
+        self._last_cpu_times: Optional[Any] = None
+        self._cpu_lock = threading.Lock()
     
     def _initialize_specific(self) -> None:
         """Initialize health-specific functionality."""
         self._start_time = datetime.now()
+        # Uptime is measured on the monotonic clock; _start_time is kept for display
+        self._start_monotonic = time.monotonic()
+        # Platform details and core counts are fixed for the process lifetime
+        self._system_info = self._collect_system_info()
+        self._cpu_counts = (psutil.cpu_count(), psutil.cpu_count(logical=True))
+        # Prime the CPU baseline so later samples report the delta without blocking
+        self._sample_cpu_percent()
         self._register_health_checks()
         self.logger.info("Health service initialized with monitoring capabilities")
     
     def _register_health_checks(self) -> None:
         """Register available health checks."""
-        self._health_checks = [
-            ("system_info", self._get_system_info),
-            ("memory_usage", self._get_memory_usage),
-            ("disk_usage", self._get_disk_usage),
-            ("application_uptime", self._get_application_uptime),
-            ("cpu_usage", self._get_cpu_usage)
-        ]
+        self._health_checks = tuple(
+            (check_name, getattr(self, method_name))
+            for check_name, method_name in zip(self._HEALTH_CHECK_NAMES, self._HEALTH_CHECK_METHODS)
+        )
     
     def get_health_status(self) -> Dict[str, Any]:
         """
@@ -86,40 +154,49 @@ class HealthService(BaseService, IHealthService):
         Returns:
             Dictionary containing detailed health information
         """
+        expiry, cached_response = self._status_cache
+        if cached_response is not None and time.monotonic() < expiry:
+            return cached_response
+        
         try:
-            health_data = {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "checks": {},
-                "summary": {
-                    "total_checks": len(self._health_checks),
-                    "passed": 0,
-                    "failed": 0
-                }
-            }
+            timestamp = datetime.now().isoformat()
+            checks = {}
+            passed = 0
+            failed = 0
             
-            # Run all health checks
-            for check_name, check_function in self._health_checks:
+            # Run all health checks concurrently, collecting results in report order
+            futures = [(check_name, _HEALTH_POOL.submit(check_function))
+                       for check_name, check_function in self._health_checks]
+            for check_name, future in futures:
                 try:
-                    check_result = check_function()
-                    health_data["checks"][check_name] = {
-                        "status": "pass",
-                        "data": check_result
-                    }
-                    health_data["summary"]["passed"] += 1
+                    checks[check_name] = {"status": "pass", "data": future.result()}
+                    passed += 1
                 except Exception as e:
-                    health_data["checks"][check_name] = {
-                        "status": "fail",
-                        "error": str(e)
-                    }
-                    health_data["summary"]["failed"] += 1
-                    self.logger.warning(f"Health check {check_name} failed: {e}")
+                    checks[check_name] = {"status": "fail", "error": str(e)}
+                    failed += 1
+                    # Expected failure branch: lazy formatting and no traceback capture
+                    self.logger.warning("Health check %s failed: %s", check_name, e)
             
             # Determine overall status
-            if health_data["summary"]["failed"] > 0:
-                health_data["status"] = "degraded" if health_data["summary"]["passed"] > 0 else "unhealthy"
+            if failed == 0:
+                status = "healthy"
+            else:
+                status = "degraded" if passed > 0 else "unhealthy"
+            
+            health_data = {
+                "status": status,
+                "timestamp": timestamp,
+                "checks": checks,
+                "summary": {
+                    "total_checks": len(self._health_checks),
+                    "passed": passed,
+                    "failed": failed
+                }
+            }
             
-            return ResponseHandler.success(health_data)
+            response = ResponseHandler.success(health_data)
+            self._status_cache = (time.monotonic() + HEALTH_STATUS_CACHE_TTL_SECONDS, response)
+            return response
             
         except Exception as e:
             error_msg = f"Error getting health status: {str(e)}"
@@ -134,15 +211,7 @@ class HealthService(BaseService, IHealthService):
             Dictionary with basic health information
         """
         try:
-            quick_data = {
-                "status": "healthy",
-                "timestamp": datetime.now().isoformat(),
-                "uptime_seconds": self._get_uptime_seconds(),
-                "memory_usage_percent": psutil.virtual_memory().percent,
-                "cpu_usage_percent": psutil.cpu_percent()
-            }
-            
-            return ResponseHandler.success(quick_data)
+            return ResponseHandler.success(self._get_quick_data())
             
         except Exception as e:
             error_msg = f"Error getting quick status: {str(e)}"
@@ -165,8 +234,26 @@ class HealthService(BaseService, IHealthService):
             self.logger.error(error_msg)
             return ResponseHandler.error(error_msg, ErrorCodes.UNEXPECTED_ERROR)
     
+    @_cached(METRIC_CACHE_TTL_SECONDS)
+    def _get_quick_data(self) -> Dict[str, Any]:
+        """Get the quick status payload."""
+        return {
+            "status": "healthy",
+            "timestamp": datetime.now().isoformat(),
+            "uptime_seconds": self._get_uptime_seconds(),
+            "memory_usage_percent": psutil.virtual_memory().percent,
+            "cpu_usage_percent": self._sample_cpu_percent()
+        }
+    
     def _get_system_info(self) -> Dict[str, Any]:
-        """Get basic system information."""
+        """Get basic system information, collected once per process."""
+        if self._system_info is None:
+            self._system_info = self._collect_system_info()
+        return self._system_info
+    
+    @staticmethod
+    def _collect_system_info() -> Dict[str, Any]:
+        """Query the platform for system information."""
         return {
             "platform": platform.platform(),
             "system": platform.system(),
@@ -176,6 +263,7 @@ class HealthService(BaseService, IHealthService):
             "hostname": platform.node()
         }
     
+    @_cached(METRIC_CACHE_TTL_SECONDS)
     def _get_memory_usage(self) -> Dict[str, Any]:
         """Get memory usage information."""
         memory = psutil.virtual_memory()
@@ -186,6 +274,7 @@ class HealthService(BaseService, IHealthService):
             "percentage": memory.percent
         }
     
+    @_cached(METRIC_CACHE_TTL_SECONDS)
     def _get_disk_usage(self) -> Dict[str, Any]:
         """Get disk usage information."""
         disk = psutil.disk_usage('/')
@@ -210,16 +299,48 @@ class HealthService(BaseService, IHealthService):
             "started_at": self._start_time.isoformat()
         }
     
+    @_cached(METRIC_CACHE_TTL_SECONDS)
     def _get_cpu_usage(self) -> Dict[str, Any]:
         """Get CPU usage information."""
+        if self._cpu_counts is None:
+            self._cpu_counts = (psutil.cpu_count(), psutil.cpu_count(logical=True))
+        core_count, logical_core_count = self._cpu_counts
         return {
-            "percentage": psutil.cpu_percent(interval=1),
-            "core_count": psutil.cpu_count(),
-            "logical_core_count": psutil.cpu_count(logical=True)
+            "percentage": self._sample_cpu_percent(),
+            "core_count": core_count,
+            "logical_core_count": logical_core_count
         }
     
+    def _sample_cpu_percent(self) -> float:
+        """
+        Get system-wide CPU usage since the previous sample without blocking.
+        
+        psutil keeps its non-blocking cpu_percent baseline per thread, so
+        samples taken on pool workers would not see the priming call. The
+        baseline is kept on the service instead and shared across threads.
+        
+        Returns:
+            CPU usage percentage, 0.0 for the priming sample
+        """
+        times = psutil.cpu_times()
+        with self._cpu_lock:
+            last_times = self._last_cpu_times
+            self._last_cpu_times = times
+        
+        if last_times is None:
+            return 0.0
+        
+        busy, total = _cpu_busy_and_total(times)
+        last_busy, last_total = _cpu_busy_and_total(last_times)
+        total_delta = total - last_total
+        if total_delta <= 0:
+            return 0.0
+        
+        percentage = (busy - last_busy) / total_delta * 100
+        return round(min(max(percentage, 0.0), 100.0), 1)
+    
     def _get_uptime_seconds(self) -> int:
         """Get application uptime in seconds."""
-        if not self._start_time:
+        if self._start_monotonic is None:
             return 0
-        return int((datetime.now() - self._start_time).total_seconds()) 
\ No newline at end of file
+        return int(time.monotonic() - self._start_monotonic) 
\ No newline at end of file
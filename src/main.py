@@ -11,7 +11,8 @@ from pathlib import Path
 
 # Add the src directory to Python path for imports
 src_path = Path(__file__).parent
-sys.path.insert(0, str(src_path))
+if str(src_path) not in sys.path:
+    sys.path.insert(0, str(src_path))
 
 from backend.config.app_settings import AppSettings
 from backend.core import Application, ApplicationFactory
@@ -49,7 +50,7 @@ def main():
     
     try:
         # Start the application
-        settings = AppSettings()
+        settings = AppSettings.from_env()
         print(f"🌐 Starting server at http://{settings.server.host}:{settings.server.port}")
         eel.start(
             'pages/index.html',